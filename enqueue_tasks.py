@@ -0,0 +1,184 @@
+import argparse
+import csv
+
+from dotenv import load_dotenv
+from sqlalchemy import insert, select, text
+
+from models import Tasks
+from database import Session
+
+load_dotenv()
+
+# Task names run_worker.py knows how to run, anything else would be silently dropped
+TASK_NAMES = ("send_invoice", "send_tracking")
+
+# Rows per INSERT statement, keeps each statement well under Postgres' bind parameter limit
+BATCH_SIZE = 1000
+
+# Advisory lock key serialising concurrent bulk imports on Postgres
+ENQUEUE_LOCK_ID = 26026
+
+REQUIRED_COLUMNS = ("order_id", "email")
+
+
+def _clean(value):
+    """Return value as a stripped string, or None if it is missing or empty."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _task_key(task_name, order_id, email, tracking_number):
+    """Normalise a task tuple the same way the String columns store it."""
+    return _clean(task_name), _clean(order_id), _clean(email), _clean(tracking_number)
+
+
+# ----------------------------
+# Bulk enqueue helper
+# ----------------------------
+def bulk_enqueue(tasks, session, dedupe=True, batch_size=BATCH_SIZE):
+    """
+    Enqueue many tasks with multi-row INSERT statements instead of one ORM object per task.
+    `tasks` is an iterable of (task_name, order_id, email, tracking_number) tuples,
+    tracking_number may be None for send_invoice.
+    With dedupe=True, tasks matching one already pending (or repeated in the input) are skipped.
+    On Postgres the dedupe check and inserts hold an advisory lock so concurrent imports
+    can't enqueue the same task twice; on other databases the check is not atomic.
+    Raises ValueError on an unknown task name or batch_size < 1.
+    Returns the number of tasks inserted.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    rows = []
+    seen = set()
+    for task in tasks:
+        key = _task_key(*task)
+        if key[0] not in TASK_NAMES:
+            raise ValueError(f"Unknown task name {task[0]!r}, expected one of {', '.join(TASK_NAMES)}")
+        if dedupe and key in seen:
+            continue
+        seen.add(key)
+        rows.append(key)
+
+    if not rows:
+        return 0
+
+    try:
+        if dedupe:
+            if session.get_bind().dialect.name == "postgresql":
+                session.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": ENQUEUE_LOCK_ID})
+
+            # One query per batch of order ids instead of one per task
+            order_ids = list({row[1] for row in rows})
+            pending = set()
+            for start in range(0, len(order_ids), batch_size):
+                result = session.execute(
+                    select(Tasks.task_name, Tasks.arg1, Tasks.arg2, Tasks.arg3)
+                    .where(Tasks.status == Tasks.TaskStatus.PENDING)
+                    .where(Tasks.arg1.in_(order_ids[start:start + batch_size]))
+                )
+                pending.update(_task_key(*r) for r in result)
+            rows = [row for row in rows if row not in pending]
+
+        for start in range(0, len(rows), batch_size):
+            session.execute(
+                insert(Tasks).values([
+                    {
+                        "task_name": task_name,
+                        "arg1": order_id,
+                        "arg2": email,
+                        "arg3": tracking_number,
+                        "status": Tasks.TaskStatus.PENDING,
+                    }
+                    for task_name, order_id, email, tracking_number in rows[start:start + batch_size]
+                ])
+            )
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    return len(rows)
+
+
+# ----------------------------
+# CSV reader
+# ----------------------------
+def read_tasks_csv(path, default_task_name=None):
+    """
+    Yield (task_name, order_id, email, tracking_number) tuples from a CSV with a header row.
+    Expected columns: task_name, order_id, email, tracking_number.
+    task_name may be omitted from the file if default_task_name is given.
+    Raises ValueError if required columns are missing or a row has an unknown task name.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        fieldnames = [name.strip() for name in reader.fieldnames or []]
+        reader.fieldnames = fieldnames
+
+        missing = [col for col in REQUIRED_COLUMNS if col not in fieldnames]
+        if "task_name" not in fieldnames and not default_task_name:
+            missing.insert(0, "task_name")
+        if missing:
+            raise ValueError(f"{path} is missing required column(s): {', '.join(missing)}")
+
+        for line_no, row in enumerate(reader, start=2):
+            task_name = _clean(row.get("task_name")) or default_task_name
+            order_id = _clean(row.get("order_id"))
+            email = _clean(row.get("email"))
+            tracking_number = _clean(row.get("tracking_number"))
+
+            if not task_name or not order_id or not email:
+                print(f"[Bulk Enqueue] Skipping line {line_no}: missing task_name, order_id or email")
+                continue
+            if task_name not in TASK_NAMES:
+                raise ValueError(
+                    f"Unknown task name {task_name!r} on line {line_no}, expected one of {', '.join(TASK_NAMES)}")
+            if task_name == "send_tracking" and not tracking_number:
+                print(f"[Bulk Enqueue] Skipping line {line_no}: send_tracking needs a tracking_number")
+                continue
+
+            yield task_name, order_id, email, tracking_number
+
+
+def positive_int(value):
+    """argparse type for integers >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not an integer")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk enqueue email tasks from a CSV file.")
+    parser.add_argument("csv_path", help="CSV with columns task_name, order_id, email, tracking_number")
+    parser.add_argument("--task-name", choices=TASK_NAMES,
+                        help="Task name to use for rows without a task_name column")
+    parser.add_argument("--no-dedupe", action="store_true",
+                        help="Insert every row even if the same task is already pending")
+    parser.add_argument("--batch-size", type=positive_int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    session = Session()
+    try:
+        inserted = bulk_enqueue(
+            read_tasks_csv(args.csv_path, default_task_name=args.task_name),
+            session,
+            dedupe=not args.no_dedupe,
+            batch_size=args.batch_size,
+        )
+        print(f"[Bulk Enqueue] Inserted {inserted} task(s) from {args.csv_path}")
+    except Exception as e:
+        print(f"[Bulk Enqueue Error]: {e}")
+        raise SystemExit(1)
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
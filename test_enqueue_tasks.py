@@ -0,0 +1,161 @@
+import os
+
+os.environ.setdefault("DATABASE_INDIA", "sqlite://")
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import enqueue_tasks
+from enqueue_tasks import bulk_enqueue, read_tasks_csv
+from models import Base, Tasks
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def all_tasks(session):
+    return sorted(
+        (t.task_name, t.arg1, t.arg2, t.arg3, t.status)
+        for t in session.query(Tasks)
+    )
+
+
+def write_csv(tmp_path, content):
+    path = tmp_path / "manifest.csv"
+    path.write_text(content)
+    return str(path)
+
+
+def test_duplicates_within_input_are_inserted_once(session):
+    inserted = bulk_enqueue([
+        ("send_tracking", "A1", "a@x.com", "T1"),
+        ("send_tracking", "A1", " a@x.com ", "T1"),
+        ("send_invoice", "A2", "b@x.com", ""),
+        ("send_invoice", "A2", "b@x.com", None),
+    ], session)
+
+    assert inserted == 2
+    assert all_tasks(session) == [
+        ("send_invoice", "A2", "b@x.com", None, "pending"),
+        ("send_tracking", "A1", "a@x.com", "T1", "pending"),
+    ]
+
+
+def test_already_pending_task_is_skipped(session):
+    session.add(Tasks(task_name="send_tracking", arg1="7", arg2="b@x", arg3="T1"))
+    session.add(Tasks(task_name="send_invoice", arg1="8", arg2="c@x", status=Tasks.TaskStatus.IN_PROGRESS))
+    session.commit()
+
+    # int order ids match the String column, and mixed types don't break batching
+    inserted = bulk_enqueue([
+        ("send_tracking", 7, "b@x", "T1"),
+        ("send_invoice", 8, "c@x", None),
+        ("send_invoice", "9", "d@x", None),
+    ], session)
+
+    assert inserted == 2
+    assert bulk_enqueue([("send_tracking", 7, "b@x", "T1")], session) == 0
+    assert len(all_tasks(session)) == 4
+
+
+def test_no_dedupe_inserts_everything(session):
+    tasks = [("send_invoice", "A1", "a@x.com", None)] * 2
+    assert bulk_enqueue(tasks, session, dedupe=False) == 2
+    assert bulk_enqueue(tasks, session, dedupe=False) == 2
+    assert len(all_tasks(session)) == 4
+
+
+def test_batches_across_several_statements(session):
+    inserts = []
+
+    @event.listens_for(session.get_bind(), "before_cursor_execute")
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT"):
+            inserts.append(statement)
+
+    tasks = [("send_invoice", f"A{i}", "a@x.com", None) for i in range(5)]
+    assert bulk_enqueue(tasks, session, batch_size=2) == 5
+    assert len(inserts) == 3
+
+    # Pending lookup is batched too, so dedupe still sees every order
+    assert bulk_enqueue(tasks, session, batch_size=2) == 0
+    assert len(all_tasks(session)) == 5
+
+
+def test_unknown_task_name_is_rejected(session):
+    with pytest.raises(ValueError, match="bogus"):
+        bulk_enqueue([("bogus", "A1", "a@x.com", None)], session)
+    assert all_tasks(session) == []
+
+
+def test_batch_size_must_be_positive(session):
+    with pytest.raises(ValueError):
+        bulk_enqueue([("send_invoice", "A1", "a@x.com", None)], session, batch_size=0)
+
+
+def test_csv_skips_incomplete_rows(tmp_path, capsys):
+    path = write_csv(tmp_path, (
+        "task_name,order_id,email,tracking_number\n"
+        "send_tracking,A1,a@x.com,T1\n"
+        "send_invoice,,b@x.com,\n"
+        "send_tracking,A3,c@x.com,\n"
+        "send_invoice,A4,d@x.com,\n"
+    ))
+
+    assert list(read_tasks_csv(path)) == [
+        ("send_tracking", "A1", "a@x.com", "T1"),
+        ("send_invoice", "A4", "d@x.com", None),
+    ]
+    out = capsys.readouterr().out
+    assert "Skipping line 3" in out
+    assert "Skipping line 4" in out
+
+
+def test_csv_default_task_name(tmp_path):
+    path = write_csv(tmp_path, "order_id,email\nA1,a@x.com\n")
+    assert list(read_tasks_csv(path, default_task_name="send_invoice")) == [
+        ("send_invoice", "A1", "a@x.com", None),
+    ]
+
+
+def test_csv_missing_columns(tmp_path):
+    path = write_csv(tmp_path, "order_id,email\nA1,a@x.com\n")
+    with pytest.raises(ValueError, match="task_name"):
+        list(read_tasks_csv(path))
+
+    path = write_csv(tmp_path, "task_name,order\nsend_invoice,A1\n")
+    with pytest.raises(ValueError, match="order_id, email"):
+        list(read_tasks_csv(path))
+
+
+def test_csv_unknown_task_name(tmp_path):
+    path = write_csv(tmp_path, "task_name,order_id,email\nsend_invoce,A1,a@x.com\n")
+    with pytest.raises(ValueError, match="send_invoce"):
+        list(read_tasks_csv(path))
+
+
+def test_cli_exits_non_zero_on_bad_header(tmp_path, monkeypatch, session):
+    path = write_csv(tmp_path, "order_id,email\nA1,a@x.com\n")
+    monkeypatch.setattr(enqueue_tasks, "Session", lambda: session)
+    monkeypatch.setattr("sys.argv", ["enqueue_tasks.py", path])
+
+    with pytest.raises(SystemExit) as exc:
+        enqueue_tasks.main()
+    assert exc.value.code == 1
+
+
+@pytest.mark.parametrize("value", ["0", "-3", "abc"])
+def test_cli_rejects_bad_batch_size(tmp_path, monkeypatch, value):
+    path = write_csv(tmp_path, "task_name,order_id,email\nsend_invoice,A1,a@x.com\n")
+    monkeypatch.setattr("sys.argv", ["enqueue_tasks.py", path, "--batch-size", value])
+
+    with pytest.raises(SystemExit) as exc:
+        enqueue_tasks.main()
+    assert exc.value.code == 2